@@ -1,26 +1,56 @@
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from backend import validators
 
 
+# ==============================================================================
+# Shared Parameters
+# ==============================================================================
+
+_REQUIRED_FIELDS = (
+    'name',
+    'description',
+    'url',
+    'version',
+    'capabilities',
+    'defaultInputModes',
+    'defaultOutputModes',
+    'skills',
+)
+_MODE_FIELDS = ('defaultInputModes', 'defaultOutputModes')
+_INVALID_URLS = ('ftp://invalid-url.com', 'example.com', '/relative/path')
+_NON_OBJECTS: tuple[Any, ...] = (None, [], 'not-an-object')
+_INVALID_PARTS: tuple[Any, ...] = (None, 'not-a-list', [])
+_INVALID_PARTS_IDS = ('missing', 'wrong_type', 'empty')
+
 # ==============================================================================
 # Fixtures
 # ==============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def valid_card_data():
-    """Fixture providing a valid agent card dictionary."""
-    return {
-        'name': 'Test Agent',
-        'description': 'An agent for testing.',
-        'url': 'https://example.com/agent',
-        'version': '1.0.0',
-        'capabilities': {'streaming': True},
-        'defaultInputModes': ['text/plain'],
-        'defaultOutputModes': ['text/plain'],
-        'skills': [{'name': 'test_skill'}],
-    }
+    """Fixture providing a valid agent card template shared by the module.
+
+    Only the top level is read-only: the nested lists and dicts are shared
+    by every test and must not be mutated. Tests that need a modified card
+    should build a new dict from it and replace nested values wholesale.
+    """
+    return MappingProxyType(
+        {
+            'name': 'Test Agent',
+            'description': 'An agent for testing.',
+            'url': 'https://example.com/agent',
+            'version': '1.0.0',
+            'capabilities': {'streaming': True},
+            'defaultInputModes': ['text/plain'],
+            'defaultOutputModes': ['text/plain'],
+            'skills': [{'name': 'test_skill'}],
+        }
+    )
 
 
 # ==============================================================================
@@ -34,34 +64,34 @@ class TestValidateAgentCard:
         errors = validators.validate_agent_card(valid_card_data)
         assert not errors
 
-    @pytest.mark.parametrize(
-        'missing_field',
-        [
-            'name',
-            'description',
-            'url',
-            'version',
-            'capabilities',
-            'defaultInputModes',
-            'defaultOutputModes',
-            'skills',
-        ],
-    )
+    @pytest.mark.parametrize('card_data', _NON_OBJECTS)
+    def test_card_not_object(self, card_data):
+        """A non-object agent card should be rejected up front."""
+        errors = validators.validate_agent_card(card_data)
+        assert errors == ('Agent card must be a JSON object.',)
+
+    @pytest.mark.parametrize('missing_field', _REQUIRED_FIELDS)
     def test_missing_required_field(self, valid_card_data, missing_field):
         """A missing required field should be detected."""
-        card_data = valid_card_data.copy()
-        del card_data[missing_field]
+        card_data = {
+            k: v for k, v in valid_card_data.items() if k != missing_field
+        }
         errors = validators.validate_agent_card(card_data)
         assert f"Required field is missing: '{missing_field}'." in errors
 
-    @pytest.mark.parametrize(
-        'invalid_url',
-        ['ftp://invalid-url.com', 'example.com', '/relative/path'],
-    )
+    @pytest.mark.parametrize('invalid_url', _INVALID_URLS)
     def test_invalid_url(self, valid_card_data, invalid_url):
         """An invalid URL format should be detected."""
-        card_data = valid_card_data.copy()
-        card_data['url'] = invalid_url
+        card_data = {**valid_card_data, 'url': invalid_url}
+        errors = validators.validate_agent_card(card_data)
+        assert (
+            "Field 'url' must be an absolute URL starting with http:// or https://."
+            in errors
+        )
+
+    def test_non_string_url(self, valid_card_data):
+        """A non-string URL should be reported instead of raising."""
+        card_data = {**valid_card_data, 'url': 123}
         errors = validators.validate_agent_card(card_data)
         assert (
             "Field 'url' must be an absolute URL starting with http:// or https://."
@@ -70,35 +100,27 @@ class TestValidateAgentCard:
 
     def test_invalid_capabilities_type(self, valid_card_data):
         """The 'capabilities' field must be an object."""
-        card_data = valid_card_data.copy()
-        card_data['capabilities'] = 'not-an-object'
+        card_data = {**valid_card_data, 'capabilities': 'not-an-object'}
         errors = validators.validate_agent_card(card_data)
         assert "Field 'capabilities' must be an object." in errors
 
-    @pytest.mark.parametrize(
-        'field', ['defaultInputModes', 'defaultOutputModes']
-    )
+    @pytest.mark.parametrize('field', _MODE_FIELDS)
     def test_invalid_modes_type_not_array(self, valid_card_data, field):
         """Input/Output modes fields must be arrays."""
-        card_data = valid_card_data.copy()
-        card_data[field] = 'not-a-list'
+        card_data = {**valid_card_data, field: 'not-a-list'}
         errors = validators.validate_agent_card(card_data)
         assert f"Field '{field}' must be an array of strings." in errors
 
-    @pytest.mark.parametrize(
-        'field', ['defaultInputModes', 'defaultOutputModes']
-    )
+    @pytest.mark.parametrize('field', _MODE_FIELDS)
     def test_invalid_modes_type_item_not_string(self, valid_card_data, field):
         """Input/Output modes arrays must contain only strings."""
-        card_data = valid_card_data.copy()
-        card_data[field] = [123, 'string']
+        card_data = {**valid_card_data, field: [123, 'string']}
         errors = validators.validate_agent_card(card_data)
         assert f"All items in '{field}' must be strings." in errors
 
     def test_invalid_skills_type(self, valid_card_data):
         """The 'skills' field must be an array."""
-        card_data = valid_card_data.copy()
-        card_data['skills'] = 'not-a-list'
+        card_data = {**valid_card_data, 'skills': 'not-a-list'}
         errors = validators.validate_agent_card(card_data)
         assert (
             "Field 'skills' must be an array of AgentSkill objects." in errors
@@ -106,8 +128,7 @@ class TestValidateAgentCard:
 
     def test_empty_skills_array(self, valid_card_data):
         """An empty 'skills' array should produce a warning."""
-        card_data = valid_card_data.copy()
-        card_data['skills'] = []
+        card_data = {**valid_card_data, 'skills': []}
         errors = validators.validate_agent_card(card_data)
         assert (
             "Field 'skills' array is empty. Agent must have at least one skill if it performs actions."
@@ -126,6 +147,12 @@ class TestValidateMessage:
         errors = validators.validate_message({})
         assert "Response from agent is missing required 'kind' field." in errors
 
+    @pytest.mark.parametrize('data', _NON_OBJECTS)
+    def test_message_not_object(self, data):
+        """A non-object message should be rejected up front."""
+        errors = validators.validate_message(data)
+        assert errors == ('Response from agent must be a JSON object.',)
+
     def test_unknown_kind(self):
         """An unknown message kind should be detected."""
         errors = validators.validate_message({'kind': 'unknown-kind'})
@@ -156,6 +183,12 @@ class TestValidateMessage:
         errors = validators.validate_message(data)
         assert "Task object missing required field: 'status.state'." in errors
 
+    def test_task_status_not_object(self):
+        """A task whose 'status' is not an object should produce an error."""
+        data = {'kind': 'task', 'id': '123', 'status': 'state'}
+        errors = validators.validate_message(data)
+        assert "Task object missing required field: 'status.state'." in errors
+
     # Tests for 'status-update' kind
     def test_valid_status_update(self):
         """A valid status-update message should produce no errors."""
@@ -200,10 +233,15 @@ class TestValidateMessage:
             in errors
         )
 
+    @pytest.mark.parametrize('artifact', _NON_OBJECTS)
+    def test_artifact_update_artifact_not_object(self, artifact):
+        """An artifact-update whose 'artifact' is not an object should produce an error."""
+        data = {'kind': 'artifact-update', 'artifact': artifact}
+        errors = validators.validate_message(data)
+        assert "Artifact object must have a non-empty 'parts' array." in errors
+
     @pytest.mark.parametrize(
-        'parts_value',
-        [None, 'not-a-list', []],
-        ids=['missing', 'wrong_type', 'empty'],
+        'parts_value', _INVALID_PARTS, ids=_INVALID_PARTS_IDS
     )
     def test_artifact_update_invalid_parts(self, parts_value):
         """An artifact-update with invalid 'parts' should produce an error."""
@@ -225,9 +263,7 @@ class TestValidateMessage:
         assert not errors
 
     @pytest.mark.parametrize(
-        'parts_value',
-        [None, 'not-a-list', []],
-        ids=['missing', 'wrong_type', 'empty'],
+        'parts_value', _INVALID_PARTS, ids=_INVALID_PARTS_IDS
     )
     def test_message_invalid_parts(self, parts_value):
         """A message with invalid 'parts' should produce an error."""
@@ -249,3 +285,27 @@ class TestValidateMessage:
             data['role'] = role_value
         errors = validators.validate_message(data)
         assert "Message from agent must have 'role' set to 'agent'." in errors
+
+
+# ==============================================================================
+# Tests for validate_messages
+# ==============================================================================
+
+
+class TestValidateMessages:
+    def test_empty_batch(self):
+        """An empty batch should produce no results."""
+        assert validators.validate_messages([]) == []
+
+    def test_results_match_each_message(self):
+        """Each message in a batch should be validated independently."""
+        batch = [
+            {'kind': 'task', 'id': '123', 'status': {'state': 'running'}},
+            {},
+            {'kind': 'message', 'parts': [{'text': 'hello'}], 'role': 'user'},
+        ]
+        assert validators.validate_messages(batch) == [
+            (),
+            ("Response from agent is missing required 'kind' field.",),
+            ("Message from agent must have 'role' set to 'agent'.",),
+        ]
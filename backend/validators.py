@@ -1,127 +1,194 @@
+import sys
+
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 
-def validate_agent_card(card_data: dict[str, Any]) -> list[str]:
-    """Validate the structure and fields of an agent card."""
-    errors: list[str] = []
+# Use a frozenset for efficient checking and to indicate immutability.
+_AGENT_CARD_REQUIRED = frozenset(
+    [
+        'name',
+        'description',
+        'url',
+        'version',
+        'capabilities',
+        'defaultInputModes',
+        'defaultOutputModes',
+        'skills',
+    ]
+)
+_MODE_FIELDS = ('defaultInputModes', 'defaultOutputModes')
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# Distinguishes a missing key from one explicitly set to None in a single
+# dict lookup.
+_MISSING = object()
+
+# Fixed agent card validation errors.
+_ERR_CARD_NOT_OBJECT = 'Agent card must be a JSON object.'
+_ERR_CARD_INVALID_URL = (
+    "Field 'url' must be an absolute URL starting with http:// or https://."
+)
+_ERR_CARD_INVALID_CAPABILITIES = "Field 'capabilities' must be an object."
+_ERR_CARD_INVALID_SKILLS = (
+    "Field 'skills' must be an array of AgentSkill objects."
+)
+_ERR_CARD_EMPTY_SKILLS = "Field 'skills' array is empty. Agent must have at least one skill if it performs actions."
+
+# Interned message kinds, so dispatch lookups can match on identity before
+# falling back to a full string comparison.
+_KIND_TASK = sys.intern('task')
+_KIND_STATUS_UPDATE = sys.intern('status-update')
+_KIND_ARTIFACT_UPDATE = sys.intern('artifact-update')
+_KIND_MESSAGE = sys.intern('message')
+
+# Shared result for valid messages, and the fixed message validation errors.
+_NO_ERRORS: tuple[str, ...] = ()
+_ERR_MESSAGE_NOT_OBJECT = 'Response from agent must be a JSON object.'
+_ERR_MISSING_KIND = "Response from agent is missing required 'kind' field."
+_ERR_TASK_MISSING_ID = "Task object missing required field: 'id'."
+_ERR_TASK_MISSING_STATE = "Task object missing required field: 'status.state'."
+_ERR_STATUS_UPDATE_MISSING_STATE = (
+    "StatusUpdate object missing required field: 'status.state'."
+)
+_ERR_ARTIFACT_UPDATE_MISSING_ARTIFACT = (
+    "ArtifactUpdate object missing required field: 'artifact'."
+)
+_ERR_ARTIFACT_EMPTY_PARTS = (
+    "Artifact object must have a non-empty 'parts' array."
+)
+_ERR_MESSAGE_EMPTY_PARTS = "Message object must have a non-empty 'parts' array."
+_ERR_MESSAGE_INVALID_ROLE = (
+    "Message from agent must have 'role' set to 'agent'."
+)
+
+
+def validate_agent_card(card_data: dict[str, Any]) -> tuple[str, ...]:
+    """Validate the structure and fields of an agent card.
+
+    Returns a tuple of error messages, empty when the card is valid.
+    """
+    if not isinstance(card_data, Mapping):
+        return (_ERR_CARD_NOT_OBJECT,)
 
-    # Use a frozenset for efficient checking and to indicate immutability.
-    required_fields = frozenset(
-        [
-            'name',
-            'description',
-            'url',
-            'version',
-            'capabilities',
-            'defaultInputModes',
-            'defaultOutputModes',
-            'skills',
-        ]
-    )
+    errors: list[str] = []
 
     # Check for the presence of all required fields
-    for field in required_fields:
-        if field not in card_data:
-            errors.append(f"Required field is missing: '{field}'.")
+    for field in _AGENT_CARD_REQUIRED - card_data.keys():
+        errors.append(f"Required field is missing: '{field}'.")
 
     # Check if 'url' is an absolute URL (basic check)
-    if 'url' in card_data and not (
-        card_data['url'].startswith('http://')
-        or card_data['url'].startswith('https://')
+    url = card_data.get('url', _MISSING)
+    if url is not _MISSING and (
+        not isinstance(url, str) or not url.startswith(_HTTP_PREFIXES)
     ):
-        errors.append(
-            "Field 'url' must be an absolute URL starting with http:// or https://."
-        )
+        errors.append(_ERR_CARD_INVALID_URL)
 
     # Check if capabilities is a dictionary
-    if 'capabilities' in card_data and not isinstance(
-        card_data['capabilities'], dict
-    ):
-        errors.append("Field 'capabilities' must be an object.")
+    capabilities = card_data.get('capabilities', _MISSING)
+    if capabilities is not _MISSING and not isinstance(capabilities, dict):
+        errors.append(_ERR_CARD_INVALID_CAPABILITIES)
 
     # Check if defaultInputModes and defaultOutputModes are arrays of strings
-    for field in ['defaultInputModes', 'defaultOutputModes']:
-        if field in card_data:
-            if not isinstance(card_data[field], list):
+    for field in _MODE_FIELDS:
+        modes = card_data.get(field, _MISSING)
+        if modes is not _MISSING:
+            if not isinstance(modes, list):
                 errors.append(f"Field '{field}' must be an array of strings.")
-            elif not all(isinstance(item, str) for item in card_data[field]):
+            elif any(type(item) is not str for item in modes):
                 errors.append(f"All items in '{field}' must be strings.")
 
     # Check skills array
-    if 'skills' in card_data:
-        if not isinstance(card_data['skills'], list):
-            errors.append(
-                "Field 'skills' must be an array of AgentSkill objects."
-            )
-        elif not card_data['skills']:
-            errors.append(
-                "Field 'skills' array is empty. Agent must have at least one skill if it performs actions."
-            )
+    skills = card_data.get('skills', _MISSING)
+    if skills is not _MISSING:
+        if not isinstance(skills, list):
+            errors.append(_ERR_CARD_INVALID_SKILLS)
+        elif not skills:
+            errors.append(_ERR_CARD_EMPTY_SKILLS)
+
+    return tuple(errors)
 
-    return errors
 
+def _is_nonempty_list(value: Any) -> bool:
+    return isinstance(value, list) and len(value) > 0
 
-def _validate_task(data: dict[str, Any]) -> list[str]:
-    errors = []
+
+def _has_status_state(data: dict[str, Any]) -> bool:
+    status = data.get('status')
+    return isinstance(status, dict) and 'state' in status
+
+
+def _validate_task(data: dict[str, Any]) -> tuple[str, ...]:
+    errors = _NO_ERRORS
     if 'id' not in data:
-        errors.append("Task object missing required field: 'id'.")
-    if 'status' not in data or 'state' not in data.get('status', {}):
-        errors.append("Task object missing required field: 'status.state'.")
+        errors += (_ERR_TASK_MISSING_ID,)
+    if not _has_status_state(data):
+        errors += (_ERR_TASK_MISSING_STATE,)
     return errors
 
 
-def _validate_status_update(data: dict[str, Any]) -> list[str]:
-    errors = []
-    if 'status' not in data or 'state' not in data.get('status', {}):
-        errors.append(
-            "StatusUpdate object missing required field: 'status.state'."
-        )
-    return errors
+def _validate_status_update(data: dict[str, Any]) -> tuple[str, ...]:
+    if not _has_status_state(data):
+        return (_ERR_STATUS_UPDATE_MISSING_STATE,)
+    return _NO_ERRORS
 
 
-def _validate_artifact_update(data: dict[str, Any]) -> list[str]:
-    errors = []
-    if 'artifact' not in data:
-        errors.append(
-            "ArtifactUpdate object missing required field: 'artifact'."
-        )
-    elif (
-        'parts' not in data.get('artifact', {})
-        or not isinstance(data.get('artifact', {}).get('parts'), list)
-        or not data.get('artifact', {}).get('parts')
+def _validate_artifact_update(data: dict[str, Any]) -> tuple[str, ...]:
+    artifact = data.get('artifact', _MISSING)
+    if artifact is _MISSING:
+        return (_ERR_ARTIFACT_UPDATE_MISSING_ARTIFACT,)
+    if not isinstance(artifact, dict) or not _is_nonempty_list(
+        artifact.get('parts')
     ):
-        errors.append("Artifact object must have a non-empty 'parts' array.")
-    return errors
+        return (_ERR_ARTIFACT_EMPTY_PARTS,)
+    return _NO_ERRORS
 
 
-def _validate_message(data: dict[str, Any]) -> list[str]:
-    errors = []
-    if (
-        'parts' not in data
-        or not isinstance(data.get('parts'), list)
-        or not data.get('parts')
-    ):
-        errors.append("Message object must have a non-empty 'parts' array.")
-    if 'role' not in data or data.get('role') != 'agent':
-        errors.append("Message from agent must have 'role' set to 'agent'.")
+def _validate_message(data: dict[str, Any]) -> tuple[str, ...]:
+    errors = _NO_ERRORS
+    if not _is_nonempty_list(data.get('parts')):
+        errors += (_ERR_MESSAGE_EMPTY_PARTS,)
+    if data.get('role') != 'agent':
+        errors += (_ERR_MESSAGE_INVALID_ROLE,)
     return errors
 
 
-def validate_message(data: dict[str, Any]) -> list[str]:
-    """Validate an incoming message from the agent based on its kind."""
-    if 'kind' not in data:
-        return ["Response from agent is missing required 'kind' field."]
+_MessageValidator = Callable[[dict[str, Any]], tuple[str, ...]]
+
+# Dispatch table mapping each message kind to its validator.
+_KIND_HANDLERS: dict[str, _MessageValidator] = {
+    _KIND_TASK: _validate_task,
+    _KIND_STATUS_UPDATE: _validate_status_update,
+    _KIND_ARTIFACT_UPDATE: _validate_artifact_update,
+    _KIND_MESSAGE: _validate_message,
+}
+
+
+def validate_message(data: dict[str, Any]) -> tuple[str, ...]:
+    """Validate an incoming message from the agent based on its kind.
+
+    Returns a tuple of error messages. Valid messages, the common case while
+    streaming, get the shared empty tuple back without any allocation.
+    """
+    if not isinstance(data, Mapping):
+        return (_ERR_MESSAGE_NOT_OBJECT,)
 
     kind = data.get('kind')
-    validators = {
-        'task': _validate_task,
-        'status-update': _validate_status_update,
-        'artifact-update': _validate_artifact_update,
-        'message': _validate_message,
-    }
-
-    validator = validators.get(str(kind))
-    if validator:
-        return validator(data)
-
-    return [f"Unknown message kind received: '{kind}'."]
+    if kind is None:
+        return (_ERR_MISSING_KIND,)
+
+    handler = _KIND_HANDLERS.get(kind) if isinstance(kind, str) else None
+    if handler:
+        return handler(data)
+
+    return (f"Unknown message kind received: '{kind}'.",)
+
+
+def validate_messages(
+    messages: Iterable[dict[str, Any]],
+) -> list[tuple[str, ...]]:
+    """Validate a batch of incoming agent messages.
+
+    Returns one result per message, in order, as from `validate_message`.
+    """
+    return [validate_message(message) for message in messages]